@@ -121,7 +121,7 @@ def steam_config_file(self, exe_location: str, require_condebug: bool) -> Option
                 found_condebug = True
                 self.log.debug(f"Found -condebug in launch options ({launch_options})")
 
-        config_mtime: int = int(os.stat(global_config_file_path).st_mtime)
+        config_mtime: int = os.stat(global_config_file_path).st_mtime_ns
         self.steam_config_mtimes[global_config_file_path] = config_mtime
         self.log.debug(f"Added mtime ({config_mtime})")
 
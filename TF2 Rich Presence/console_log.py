@@ -258,7 +258,9 @@ def interpret(self, console_log_path: str, user_usernames: Set[str], kb_limit: f
         queued_state = "Queued"
 
     scan_results = (in_menus, tf2_map, tf2_class, server_address, queued_state, hosting)
-    self.log.debug(f"console.log parse results: {scan_results}")
+
+    if self.log.debug_enabled():
+        self.log.debug(f"console.log parse results: {scan_results}")
 
     # remove empty lines (bot spam probably) and some error logs
     # TODO: move this into a function
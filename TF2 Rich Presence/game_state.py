@@ -39,6 +39,7 @@ class GameState:
         self.last_server_request_address: str = ''
         self.updated_server_state: bool = False
         self.force_zero_map_time: bool = False
+        self.force_zero_start_time: bool = False
 
         if log:
             self.log: logger.Log = log
@@ -95,11 +96,7 @@ class GameState:
                 large_text_base = self.loc.text(self.gamemode_fancy)
             else:
                 large_text_base = self.map_fancy
-
-                if self.tf2_map in map_fallbacks:
-                    large_image = f'z_{map_fallbacks[self.tf2_map]}'
-                else:
-                    large_image = f'z_{self.tf2_map}'
+                large_image = f'z_{map_fallbacks.get(self.tf2_map, self.tf2_map)}'
 
             if self.hosting or self.custom_map:
                 top_line = self.map_line
@@ -142,12 +139,13 @@ class GameState:
 
         large_text: str = self.loc.text("{0} - TF2 Rich Presence {1}").format(large_text_base, launcher.VERSION)
 
-        return {'details': top_line, 'state': bottom_line, 'timestamps': {'start': self.game_start_time},
+        return {'details': top_line, 'state': bottom_line, 'timestamps': {'start': 0 if self.force_zero_start_time else self.game_start_time},
                 'assets': {'large_image': large_image, 'large_text': large_text, 'small_image': small_image, 'small_text': small_text}}
 
     # set everything straight from console.log parse results
     def set_bulk(self, state: Tuple[bool, str, str, str, str, bool]):
-        prev_state: str = str(self)
+        log_state_change: bool = self.log.debug_enabled()
+        prev_state: str = str(self) if log_state_change else ''
 
         self.set_in_menus(state[0])
         self.set_hosting(state[5])
@@ -156,8 +154,11 @@ class GameState:
         self.set_queued_state(state[4])
         self.server_address = state[3]  # this isn't a setter because it doesn't directly mean changed server data
 
-        if str(self) != prev_state:  # don't use self.update_rpc because of server data changes not mattering here
-            self.log.debug(f"Game state updated from ({prev_state}) to ({str(self)})")
+        if log_state_change:
+            new_state: str = str(self)
+
+            if new_state != prev_state:  # don't use self.update_rpc because of server data changes not mattering here
+                self.log.debug(f"Game state updated from ({prev_state}) to ({new_state})")
 
     def set_in_menus(self, in_menus: bool):
         if in_menus != self.in_menus:
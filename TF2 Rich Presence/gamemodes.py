@@ -5,7 +5,8 @@
 import functools
 import json
 import os
-from typing import Dict, List, Tuple, Union
+import types
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 import game_state
 import launcher
@@ -19,21 +20,17 @@ def get_map_gamemode(log: logger.Log, map_filename: str) -> Union[Tuple[str, str
         log.error("Map filename is blank")
         return map_filename, 'unknown', 'Unknown gamemode', False
 
-    map_gamemodes: Dict[str, List[str]] = load_maps_db()
+    map_data: Optional[list] = maps_db.get(map_filename)
 
-    if map_filename in map_gamemodes:
-        map_data: list = map_gamemodes[map_filename]
+    if map_data is not None:
         map_data.append(False)
 
         # add some formatting for maps with multiple gamemodes
         if map_filename in game_state.ambiguous_maps:
-            if map_data[1] in modes_short:
-                map_data[0] = f'{map_data[0]} ({modes_short[map_data[1]]})'
-            else:
-                map_data[0] = f'{map_data[0]} ({map_data[2]})'
+            map_data[0] = f'{map_data[0]} ({modes_short.get(map_data[1], map_data[2])})'
 
         return map_data
-    elif not map_gamemodes:
+    elif not maps_db:
         log.error("maps.json failed to load")
 
     log.debug(f"Finding gamemode for custom map: {map_filename}")
@@ -48,8 +45,9 @@ def get_map_gamemode(log: logger.Log, map_filename: str) -> Union[Tuple[str, str
 
     # determine based on the map prefix
     map_prefix: str = map_filename.split('_')[0]
-    if map_prefix in prefixes and '_' in map_filename:
-        gamemode = prefixes[map_prefix]
+    prefix_gamemode: Optional[str] = prefixes.get(map_prefix)
+    if prefix_gamemode is not None and '_' in map_filename:
+        gamemode = prefix_gamemode
         gamemode_fancy = modes[gamemode]
         log.debug(f"Determined gamemode to be {(gamemode, gamemode_fancy)}) based on prefix ({map_prefix}_)")
         return map_filename, gamemode, gamemode_fancy, True
@@ -58,36 +56,37 @@ def get_map_gamemode(log: logger.Log, map_filename: str) -> Union[Tuple[str, str
     return map_filename, 'unknown', 'Unknown gamemode', True
 
 
-# load maps database from maps.json
-@functools.cache
+# the maps database from maps.json, which is loaded once on import
 def load_maps_db() -> Dict[str, List[str]]:
-    maps_db_path = 'maps.json' if launcher.DEBUG else os.path.join('resources', 'maps.json')
-
-    if os.path.isfile(maps_db_path):
-        with open(maps_db_path, 'r') as maps_db:
-            return json.load(maps_db)
-    else:
-        return {}
-
-
-modes: Dict[str, str] = {'ctf': 'Capture the Flag', 'control-point': 'Control Point', 'attack-defend': 'Attack/Defend', 'medieval-mode': 'Attack/Defend (Medieval Mode)',
-                         'territorial-control': 'Territorial Control', 'payload': 'Payload', 'payload-race': 'Payload Race', 'koth': 'King of the Hill', 'special-delivery': 'Special Delivery',
-                         'mvm': 'Mann vs. Machine', 'beta-map': 'Robot Destruction', 'mannpower': 'Mannpower', 'passtime': 'PASS Time', 'player-destruction': 'Player Destruction',
-                         'arena': 'Arena', 'training': 'Training', 'surfing': 'Surfing', 'trading': 'Trading', 'jumping': 'Jumping', 'deathmatch': 'Deathmatch', 'cp-orange': 'Orange',
-                         'versus-saxton-hale': 'Versus Saxton Hale', 'deathrun': 'Deathrun', 'achievement': 'Achievement', 'breakout': 'Jail Breakout', 'slender': 'Slender',
-                         'dodgeball': 'Dodgeball', 'zombie': 'Zombie', 'mario-kart': 'Mario Kart', 'prophunt': 'Prop Hunt', 'mge-mod': 'MGE Mod'}
-
-prefixes: Dict[str, str] = {'ctf': 'ctf', 'tc': 'territorial-control', 'pl': 'payload', 'plr': 'payload-race', 'koth': 'koth', 'sd': 'special-delivery', 'mvm': 'mvm', 'rd': 'beta-map',
-                            'pass': 'passtime', 'pd': 'player-destruction', 'arena': 'arena', 'tr': 'training', 'surf': 'surfing', 'cp': 'control-point', 'trade': 'trading', 'jump': 'jumping',
-                            'dm': 'deathmatch', 'vsh': 'versus-saxton-hale', 'dr': 'deathrun', 'achievement': 'achievement', 'jb': 'breakout', 'slender': 'slender', 'tfdb': 'dodgeball',
-                            'zs': 'zombie', 'ze': 'zombie', 'zf': 'zombie', 'zm': 'zombie', 'duel': 'deathmatch', 'sn': 'deathmatch', 'ba': 'breakout', 'jail': 'breakout', 'idle': 'trading',
-                            'mario': 'mario-kart', 'ph': 'prophunt', 'mge': 'mge-mod'}
-
-substrings: Dict[str, str] = {'cp_orange': 'cp-orange', 'training': 'training'}
-modes_short: Dict[str, str] = {'ctf': 'CTF', 'control-point': '5CP', 'attack-defend': 'A/D', 'medieval-mode': 'A/D (Medieval)',
-                               'koth': 'KotH', 'mvm': 'MvM'}  # yes there are some unused ones but hey, futureproofing
+    return maps_db
+
+
+modes: Mapping[str, str] = types.MappingProxyType({'ctf': 'Capture the Flag', 'control-point': 'Control Point', 'attack-defend': 'Attack/Defend', 'medieval-mode': 'Attack/Defend (Medieval Mode)',
+                                                   'territorial-control': 'Territorial Control', 'payload': 'Payload', 'payload-race': 'Payload Race', 'koth': 'King of the Hill', 'special-delivery': 'Special Delivery',
+                                                   'mvm': 'Mann vs. Machine', 'beta-map': 'Robot Destruction', 'mannpower': 'Mannpower', 'passtime': 'PASS Time', 'player-destruction': 'Player Destruction',
+                                                   'arena': 'Arena', 'training': 'Training', 'surfing': 'Surfing', 'trading': 'Trading', 'jumping': 'Jumping', 'deathmatch': 'Deathmatch', 'cp-orange': 'Orange',
+                                                   'versus-saxton-hale': 'Versus Saxton Hale', 'deathrun': 'Deathrun', 'achievement': 'Achievement', 'breakout': 'Jail Breakout', 'slender': 'Slender',
+                                                   'dodgeball': 'Dodgeball', 'zombie': 'Zombie', 'mario-kart': 'Mario Kart', 'prophunt': 'Prop Hunt', 'mge-mod': 'MGE Mod'})
+
+prefixes: Mapping[str, str] = types.MappingProxyType({'ctf': 'ctf', 'tc': 'territorial-control', 'pl': 'payload', 'plr': 'payload-race', 'koth': 'koth', 'sd': 'special-delivery', 'mvm': 'mvm', 'rd': 'beta-map',
+                                                      'pass': 'passtime', 'pd': 'player-destruction', 'arena': 'arena', 'tr': 'training', 'surf': 'surfing', 'cp': 'control-point', 'trade': 'trading', 'jump': 'jumping',
+                                                      'dm': 'deathmatch', 'vsh': 'versus-saxton-hale', 'dr': 'deathrun', 'achievement': 'achievement', 'jb': 'breakout', 'slender': 'slender', 'tfdb': 'dodgeball',
+                                                      'zs': 'zombie', 'ze': 'zombie', 'zf': 'zombie', 'zm': 'zombie', 'duel': 'deathmatch', 'sn': 'deathmatch', 'ba': 'breakout', 'jail': 'breakout', 'idle': 'trading',
+                                                      'mario': 'mario-kart', 'ph': 'prophunt', 'mge': 'mge-mod'})
+
+substrings: Mapping[str, str] = types.MappingProxyType({'cp_orange': 'cp-orange', 'training': 'training'})
+modes_short: Mapping[str, str] = types.MappingProxyType({'ctf': 'CTF', 'control-point': '5CP', 'attack-defend': 'A/D', 'medieval-mode': 'A/D (Medieval)',
+                                                         'koth': 'KotH', 'mvm': 'MvM'})  # yes there are some unused ones but hey, futureproofing
 have_drawing: tuple[str, ...] = ('attack-defend', 'control-point', 'ctf', 'koth', 'mannpower', 'mvm', 'passtime', 'payload', 'payload-race', 'special-delivery', 'training')
 
+# load maps database from maps.json, only once since it doesn't change while running
+maps_db_path: str = 'maps.json' if launcher.DEBUG else os.path.join('resources', 'maps.json')
+if os.path.isfile(maps_db_path):
+    with open(maps_db_path, 'r') as maps_db_file:
+        maps_db: Dict[str, List[str]] = json.load(maps_db_file)
+else:
+    maps_db = {}
+
 if __name__ == '__main__':
     print(get_map_gamemode(logger.Log(), 'pl_borneo'))
     print(get_map_gamemode(logger.Log(), 'cp_catwalk_a5c'))
@@ -25,17 +25,20 @@ import settings_gui
 import updater
 import utils
 
+images_path: str = 'gui_images' if launcher.DEBUG else os.path.join('resources', 'gui_images')
+
 
 class GUI(tk.Frame):
-    def __init__(self, log: logger.Log, main_controlled: bool = False):
+    def __init__(self, log: logger.Log, main_controlled: bool = False, loc: Optional[localization.Localizer] = None):
         self.main_controlled: bool = main_controlled
         self.log: logger.Log = log
         self.log.info("Initializing main GUI")
-        self.loc: localization.Localizer = localization.Localizer(self.log)
+        self.loc: localization.Localizer = loc if loc else localization.Localizer(self.log)
         self.master: tk.Tk = tk.Tk()
         tk.Frame.__init__(self, self.master)
         self.pack(fill=tk.BOTH, expand=1, padx=0, pady=0)
         self.alive: bool = True
+        self.wake_var: tk.BooleanVar = tk.BooleanVar(self.master, value=False)
 
         self.scale: float = settings.get('gui_scale') / 100
         self.size: Tuple[int, int] = (round(500 * self.scale), round(250 * self.scale))
@@ -62,6 +65,8 @@ class GUI(tk.Frame):
         self.bottom_text_state: Dict[str, bool] = {'discord': False, 'kataiser': False, 'queued': False, 'holiday': False}
         self.bottom_text_queue_state: str = ""
         self.holiday_text: str = ""
+        self.discord_text: str = self.loc.text("Can't connect to Discord")
+        self.kataiser_text: str = self.loc.text("Hey, it seems that Kataiser, the developer of TF2 Rich Presence, is in your game!\nSay hi to me if you'd like :)")
         self.launched_tf2_with_button: bool = False
         self.tf2_launch_cmd: Optional[Tuple[str, str]] = None
         self.main_loop_body_times: List[float] = []
@@ -154,6 +159,21 @@ class GUI(tk.Frame):
             else:
                 raise
 
+    # wait without blocking the GUI, by letting Tk's event loop run until either the time is up or the window is closed
+    def sleep(self, seconds: float):
+        if not self.alive:
+            return
+
+        try:
+            wake_timer: str = self.master.after(round(seconds * 1000), self.wake_var.set, True)
+            self.master.wait_variable(self.wake_var)
+            self.master.after_cancel(wake_timer)
+        except tk.TclError as error:
+            if "application has been destroyed" in str(error) or "invalid command name" in str(error):
+                pass
+            else:
+                raise
+
     # set the BG and line states (1 line, for processes not running)
     def set_state_1(self, bg: str, line: str):
         bg_state: Tuple[str, int, int] = (bg, 0, 0)  # None would be cleaner but I want to keep the same tuple configuration
@@ -231,8 +251,8 @@ class GUI(tk.Frame):
     def set_bottom_text(self, state: str, enabled: bool) -> str:
         prev_text: str = ""
         text: str = ""
-        states: dict[str, str] = {'discord': self.loc.text("Can't connect to Discord"),
-                                  'kataiser': self.loc.text("Hey, it seems that Kataiser, the developer of TF2 Rich Presence, is in your game!\nSay hi to me if you'd like :)"),
+        states: dict[str, str] = {'discord': self.discord_text,
+                                  'kataiser': self.kataiser_text,
                                   'queued': self.bottom_text_queue_state,
                                   'holiday': self.holiday_text}
 
@@ -408,7 +428,6 @@ class GUI(tk.Frame):
     # load a .webp image from gui_images, mode can be RGBA or RGB. image_name shouldn't have the file extension and can have forward slashes
     @functools.cache
     def load_image(self, image_name: str, mode: str = 'RGBA') -> Image:
-        images_path: str = 'gui_images' if launcher.DEBUG else os.path.join('resources', 'gui_images')
         image_name_fixed: str = image_name.replace('/', os.path.sep)
         image_path: str = os.path.join(images_path, f'{image_name_fixed}.webp')
 
@@ -637,6 +656,11 @@ class GUI(tk.Frame):
 
         if self.main_controlled:
             self.alive = False  # this makes main raise SystemExit ASAP
+
+            try:
+                self.wake_var.set(True)  # stop sleeping if main is, which it probably is
+            except tk.TclError:
+                pass
         else:
             del self.log
             raise SystemExit
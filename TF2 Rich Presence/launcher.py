@@ -27,8 +27,10 @@ import traceback
 import zlib
 from tkinter import messagebox
 
-sys.path.append(os.path.abspath('resources'))
-sys.path.append(os.path.abspath(os.path.join('resources', 'packages')))
+# when run directly, this file gets executed twice (as __main__ and as launcher), so don't add duplicate import paths
+for package_path in (os.path.abspath('resources'), os.path.abspath(os.path.join('resources', 'packages'))):
+    if package_path not in sys.path:
+        sys.path.append(package_path)
 import sentry_sdk
 
 import utils
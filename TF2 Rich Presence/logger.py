@@ -7,6 +7,7 @@ import functools
 import getpass
 import gzip
 import os
+import shutil
 import socket
 import sys
 import time
@@ -87,14 +88,17 @@ class Log:
         return f"logger.Log at {self.filename} (enabled={bool(self)}, level={settings.get('log_level')}, stderr={self.to_stderr})"
 
     # this should be run whenever the program closes
-    def __del__(self):
+    def close(self, via: str = "close()"):
         try:
             if self.enabled() and not self.log_file.closed:
-                self.debug(f"Closing log file ({self.filename}) via destructor")
+                self.debug(f"Closing log file ({self.filename}) via {via}")
                 self.log_file.close()
         except Exception as error:
             print(f"Couldn't safely close log: {error}'")
 
+    def __del__(self):
+        self.close("destructor")
+
     def enabled(self) -> bool:
         return settings.get('log_level') != 'Off' and not self.force_disabled
 
@@ -106,6 +110,10 @@ class Log:
     def log_level_allowed(self, level: str):
         return level in self.log_levels_allowed()
 
+    # lets callers skip building expensive debug messages that would just be thrown away
+    def debug_enabled(self) -> bool:
+        return self.log_level_allowed('Debug') and self.enabled()
+
     # adds a line to the current log file
     def write_log(self, level: str, message_out: str, use_errors_file: bool = False):
         if self.enabled():
@@ -198,19 +206,19 @@ class Log:
         self.debug(f"Deleted {len(deleted_logs)} log(s): {deleted_logs}")
 
         for old_log in [log for log in all_logs if not log.endswith('.gz') and os.path.isfile(log) and log != self.filename]:
-            with open(old_log, 'rb') as old_log_r:
-                data_in: bytes = old_log_r.read()
-                data_out: bytes = gzip.compress(data_in)
+            compressed_log: str = f'{old_log}.gz'
+            old_log_size: int = os.stat(old_log).st_size
 
-                with open(f'{old_log}.gz', 'wb') as old_log_w:
-                    old_log_w.write(data_out)
+            # stream it through a fast compression level, since this happens during startup
+            with open(old_log, 'rb') as old_log_r, gzip.open(compressed_log, 'wb', compresslevel=1) as old_log_w:
+                shutil.copyfileobj(old_log_r, old_log_w)
 
             try:
                 os.remove(old_log)
             except Exception:
                 self.error(f"Couldn't replace log file {old_log}: {traceback.format_exc()}")
 
-            compressed_logs.append((old_log, round(len(data_in) / 1024, 1), round(len(data_out) / 1024, 1)))
+            compressed_logs.append((old_log, round(old_log_size / 1024, 1), round(os.stat(compressed_log).st_size / 1024, 1)))
 
         self.debug(f"Compressed {len(compressed_logs)} log(s): {compressed_logs}")
 
@@ -21,13 +21,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import datetime
+import atexit
 import gc
 import os
 import platform
 import time
 import traceback
-from typing import Any, Dict, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import psutil
 from discoIPC import ipc
@@ -49,10 +49,15 @@ __copyright__ = "Copyright (C) 2018-2021 Kataiser & https://github.com/Kataiser/
 __license__ = "GPL-3.0"
 __email__ = "Mecharon1.gm@gmail.com"
 
+custom_functions_path: str = 'custom.py' if launcher.DEBUG else os.path.join('resources', 'custom.py')
+STEAM_CONFIG_CHECK_INTERVAL: int = 10  # launch options are rarely changed, so checking Steam's config files for that every loop is a waste
+queued_fg_images: Dict[str, str] = {"Queued for Casual": 'casual', "Queued for Competitive": 'comp'}  # MvM has multiple tours, so it's checked separately
+
 
 def launch():
     try:
         gc.disable()
+        gc.freeze()  # everything from importing sticks around for the whole program, so don't make the GC scan it again
 
         log_main: logger.Log = logger.Log()
         log_main.to_stderr = launcher.DEBUG
@@ -80,6 +85,8 @@ class TF2RichPresense:
             self.log = logger.Log()
             self.log.error(f"Initialized main.TF2RichPresense without a log, defaulting to one at {self.log.filename}")
 
+        atexit.register(self.log.close, "atexit")
+
         settings.fix_settings(self.log)
         default_settings: dict = settings.defaults()
         current_settings: dict = settings.access_registry()
@@ -89,9 +96,15 @@ class TF2RichPresense:
         else:
             self.log.debug(f"Non-default settings: {settings.compare_settings(default_settings, current_settings)}")
 
-        self.gui: gui.GUI = gui.GUI(self.log, main_controlled=True)
+        self.loc: localization.Localizer = localization.Localizer(self.log)  # shared with the GUI and game state, since creating one clears Localizer.text's cache
+        self.gui: gui.GUI = gui.GUI(self.log, main_controlled=True, loc=self.loc)
         self.process_scanner: processes.ProcessScanner = processes.ProcessScanner(self.log)
-        self.loc: localization.Localizer = localization.Localizer(self.log)
+        # these get used every loop, so only localize them once
+        self.base_window_title: str = self.loc.text("TF2 Rich Presence ({0})").format(launcher.VERSION)
+        self.format_window_title_menus: Callable[..., str] = self.loc.text("{0} - {1} ({2})").format
+        self.format_window_title_main: Callable[..., str] = self.loc.text("{0} - {1} on {2}").format
+        self.format_window_title_waiting: Callable[..., str] = self.loc.text("{0} - Waiting for {1}").format
+        self.format_time_elapsed: Callable[..., str] = self.loc.text("{0} elapsed").format
         self.game_state: game_state.GameState = game_state.GameState(self.log, self.loc)
         self.rpc_client: Optional[ipc.DiscordIPC] = None
         self.client_connected: bool = False
@@ -110,6 +123,7 @@ class TF2RichPresense:
         self.usernames: Set[str] = set()
         self.last_name_scan_time: float = time.time()  # close enough
         self.steam_config_mtimes: Dict[str, int] = {}
+        self.last_steam_config_check_time: float = 0.0
         self.cleanup_primed: bool = True
         self.slow_sleep_time: bool = False
         self.has_set_process_priority: bool = not set_process_priority
@@ -149,8 +163,6 @@ class TF2RichPresense:
 
     # import custom functionality
     def import_custom(self):
-        custom_functions_path: str = 'custom.py' if launcher.DEBUG else os.path.join('resources', 'custom.py')
-
         if os.path.isfile(custom_functions_path):
             with open(custom_functions_path, 'r') as custom_functions_file:
                 custom_functions_lines: int = len(custom_functions_file.readlines())
@@ -167,14 +179,11 @@ class TF2RichPresense:
             self.loop_body()
 
             # rich presence only updates every 15 seconds, but it listens constantly so sending every 2 or 5 seconds (by default) is probably fine
-            sleep_time: int = settings.get('wait_time_slow') if self.slow_sleep_time else settings.get('wait_time')
-            sleep_time_started: float = time.perf_counter()
+            sleep_time: int = settings.get('wait_time_slow' if self.slow_sleep_time else 'wait_time')
             self.log.debug(f"Sleeping for {sleep_time} seconds (slow = {self.slow_sleep_time})")
 
             if not self.fast_next_loop:
-                while time.perf_counter() - sleep_time_started < sleep_time and self.gui.alive:
-                    time.sleep(1 / 30)  # 30 Hz updates (btw tell me if this is stupid)
-                    self.gui.safe_update()
+                self.gui.sleep(sleep_time)  # keeps the GUI responsive, and returns early if it gets closed
 
             if once:
                 break
@@ -183,8 +192,7 @@ class TF2RichPresense:
     def loop_body(self):
         # because closing the GUI doesn't actually exit the program
         if not self.gui.alive:
-            del self.log
-            raise SystemExit
+            raise SystemExit(0)  # the log gets closed by atexit
 
         loop_start_time: float = time.perf_counter()
         self.slow_sleep_time = False
@@ -197,89 +205,86 @@ class TF2RichPresense:
             self.custom_functions.before_loop(self)
 
         p_data: Dict[str, Dict[str, Union[bool, str, int, None]]] = self.process_scanner.scan()
+        tf2_data: Dict[str, Union[bool, str, int, None]] = p_data['TF2']
+        steam_data: Dict[str, Union[bool, str, int, None]] = p_data['Steam']
+        tf2_running: bool = tf2_data['running']
+        steam_running: bool = steam_data['running']
+        discord_running: bool = p_data['Discord']['running']
 
         if self.process_scanner.tf2_without_condebug:
             self.no_condebug = True
 
-        if p_data['Steam']['running']:
+        if steam_running:
             username_count: int = len(self.usernames)
             self.usernames.add(configs.get_steam_username())
             if len(self.usernames) != username_count:
                 self.log.debug(f"Username(s) updated: {self.usernames}")
 
-            if not p_data['TF2']['running']:
+            if not tf2_running:
                 # reads steam config files to find TF2 launch options (on first loop, and if any of them have been modified)
                 config_scan_needed: bool = self.steam_config_mtimes == {} or not self.gui.tf2_launch_cmd
 
-                for steam_config in self.steam_config_mtimes:
-                    old_mtime: int = self.steam_config_mtimes[steam_config]
-                    new_mtime: int = int(os.stat(steam_config).st_mtime)
+                if not config_scan_needed and time.time() - self.last_steam_config_check_time >= STEAM_CONFIG_CHECK_INTERVAL:
+                    self.last_steam_config_check_time = time.time()
 
-                    if new_mtime > old_mtime:
-                        self.log.debug(f"Rescanning Steam config files ({new_mtime} > {old_mtime} for {steam_config})")
-                        config_scan_needed = True
+                    for steam_config, old_mtime in self.steam_config_mtimes.items():
+                        new_mtime: int = os.stat(steam_config).st_mtime_ns
+
+                        if new_mtime > old_mtime:
+                            self.log.debug(f"Rescanning Steam config files ({new_mtime} > {old_mtime} for {steam_config})")
+                            config_scan_needed = True
+                            break  # all of them get rescanned anyway
 
                 if config_scan_needed:
                     # to be clear, this scan is always needed but doesn't need to be re-done every loop
-                    tf2_exe_path: str = self.find_tf2_exe(p_data['Steam']['path'])
+                    self.last_steam_config_check_time = time.time()  # it just found the current mtimes, so no need to stat them again right away
+                    tf2_exe_path: str = self.find_tf2_exe(steam_data['path'])
                     need_condebug: bool = not self.gui.launched_tf2_with_button and self.process_scanner.tf2_without_condebug
-                    tf2_launch_cmd: Optional[str] = self.steam_config_file(p_data['Steam']['path'], need_condebug)
+                    tf2_launch_cmd: Optional[str] = self.steam_config_file(steam_data['path'], need_condebug)
 
                     if tf2_exe_path and tf2_launch_cmd is not None:
                         self.gui.tf2_launch_cmd = (tf2_exe_path, tf2_launch_cmd)
                         self.log.debug(f"Set launch TF2 command to {self.gui.tf2_launch_cmd}")
                     elif self.process_scanner.tf2_without_condebug:
                         self.no_condebug = True
-        else:
-            if p_data['Steam']['pid'] is not None or p_data['Steam']['path'] is not None:
-                self.log.error(f"Steam isn't running but its process info is {p_data['Steam']}. WTF?")
+        elif tf2_running:
+            self.log.error("TF2 is running but Steam isn't. WTF?")
 
-            if p_data['TF2']['running']:
-                self.log.error("TF2 is running but Steam isn't. WTF?")
-
-        if p_data['TF2']['running'] and p_data['Discord']['running'] and p_data['Steam']['running']:
+        if tf2_running and discord_running and steam_running:
             # modifies a few tf2 config files
             if not self.has_checked_class_configs:
-                configs.class_config_files(self.log, p_data['TF2']['path'])
+                configs.class_config_files(self.log, tf2_data['path'])
                 self.has_checked_class_configs = True
 
-            self.game_state.game_start_time = p_data['TF2']['time']
+            self.game_state.game_start_time = tf2_data['time']
             self.gui.set_console_log_button_states(True)
             self.gui.set_launch_tf2_button_state(False)
             self.gui.set_bottom_text('discord', False)
             self.reset_launched_with_button = True
 
-            console_log_path: str = os.path.join(p_data['TF2']['path'], 'tf', 'console.log')
+            console_log_path: str = os.path.join(tf2_data['path'], 'tf', 'console.log')
             self.gui.console_log_path = console_log_path
-            console_log_parsed: Optional[Tuple[bool, str, str, str, str, bool]] = self.interpret_console_log(console_log_path, self.usernames, tf2_start_time=p_data['TF2']['time'])
+            console_log_parsed: Optional[Tuple[bool, str, str, str, str, bool]] = self.interpret_console_log(console_log_path, self.usernames, tf2_start_time=tf2_data['time'])
             self.old_console_log_mtime = self.console_log_mtime
 
             if console_log_parsed:
                 self.game_state.set_bulk(console_log_parsed)
 
-            base_window_title: str = self.loc.text("TF2 Rich Presence ({0})").format(launcher.VERSION)
-            window_title_format_menus: str = self.loc.text("{0} - {1} ({2})")
-            window_title_format_main: str = self.loc.text("{0} - {1} on {2}")
-
             if self.game_state.in_menus:
                 self.test_state = 'menus'
-                window_title: str = window_title_format_menus.format(base_window_title, "In menus", self.loc.text(self.game_state.queued_state))
+                window_title: str = self.format_window_title_menus(self.base_window_title, "In menus", self.loc.text(self.game_state.queued_state))
             else:
                 self.test_state = 'in game'
-                window_title = window_title_format_main.format(base_window_title, self.game_state.tf2_class, self.game_state.map_fancy)
+                window_title = self.format_window_title_main(self.base_window_title, self.game_state.tf2_class, self.game_state.map_fancy)
 
                 # get server data, if needed (game_state doesn't handle it itself)
-                server_modes = []
-                if settings.get('top_line') in ('Player count', 'Kills'):
-                    server_modes.append(settings.get('top_line'))
-                if settings.get('bottom_line') in ('Player count', 'Kills'):
-                    server_modes.append(settings.get('bottom_line'))
+                server_modes: List[str] = [line_setting for line_setting in (settings.get('top_line'), settings.get('bottom_line')) if line_setting in ('Player count', 'Kills')]
                 self.game_state.update_server_data(server_modes, self.usernames)
 
             if self.custom_functions:
                 self.custom_functions.modify_game_state(self)
 
-            self.set_gui_from_game_state(p_data['TF2']['time'])
+            self.set_gui_from_game_state(tf2_data['time'])
 
             if self.custom_functions:
                 self.custom_functions.modify_gui(self)
@@ -297,7 +302,7 @@ class TF2RichPresense:
             self.gui.master.title(window_title)
             self.log.debug(f"Set window title to \"{window_title}\"")
 
-        elif not p_data['TF2']['running']:
+        elif not tf2_running:
             # there's probably a better way to do this
             if self.reset_launched_with_button:
                 self.gui.launched_tf2_with_button = False
@@ -306,21 +311,21 @@ class TF2RichPresense:
             if self.gui.launched_tf2_with_button:
                 self.log.debug("Skipping possibly resetting launch button due to game hopefully launching")
             else:
-                self.gui.set_launch_tf2_button_state(p_data['Steam']['running'])
+                self.gui.set_launch_tf2_button_state(steam_running)
 
             self.last_console_log_size = None
             self.necessary_program_not_running('Team Fortress 2', 'TF2')
             self.should_mention_tf2 = False
-        elif not p_data['Discord']['running']:
+        elif not discord_running:
             self.necessary_program_not_running('Discord')
             self.should_mention_discord = False
-            self.gui.set_launch_tf2_button_state(p_data['Steam']['running'])
+            self.gui.set_launch_tf2_button_state(steam_running)
             self.gui.launch_tf2_button['state'] = 'disabled'
         else:
             # last but not least, Steam
             self.necessary_program_not_running('Steam')
             self.should_mention_steam = False
-            self.gui.set_launch_tf2_button_state(p_data['Steam']['running'])
+            self.gui.set_launch_tf2_button_state(steam_running)
             self.gui.launch_tf2_button['state'] = 'disabled'
 
         self.gui.safe_update()
@@ -348,7 +353,8 @@ class TF2RichPresense:
         if not gc.isenabled():
             gc.enable()
             gc.collect()
-            self.log.debug("Enabled GC and collected")
+            gc.freeze()  # whatever survived startup (GUI, DB cache, sessions) is long-lived, so keep automatic collections from rescanning it
+            self.log.debug("Enabled GC, collected, and froze survivors")
 
         self.gui.main_loop_body_times.append(round(time.perf_counter() - loop_start_time, 2))
         return self.client_connected, self.rpc_client
@@ -356,24 +362,22 @@ class TF2RichPresense:
     # tell the GUI what it needs to look like, based on self.game_state
     def set_gui_from_game_state(self, tf2_start_time: Optional[int] = None):
         if tf2_start_time:
-            time_elapsed_num: str = str(datetime.timedelta(seconds=int(time.time() - tf2_start_time)))
-            time_elapsed: str = self.loc.text("{0} elapsed").format(time_elapsed_num.removeprefix('0:').removeprefix('0'))
+            elapsed_minutes, elapsed_seconds = divmod(max(int(time.time() - tf2_start_time), 0), 60)
+            elapsed_hours, elapsed_minutes = divmod(elapsed_minutes, 60)
+            time_elapsed_num: str = f'{elapsed_hours}:{elapsed_minutes:02}:{elapsed_seconds:02}' if elapsed_hours else f'{elapsed_minutes}:{elapsed_seconds:02}'
+            time_elapsed: str = self.format_time_elapsed(time_elapsed_num)
         else:
-            time_elapsed = self.loc.text("{0} elapsed").format('0:00')
+            time_elapsed = self.format_time_elapsed('0:00')
 
         if self.game_state.in_menus:
             self.gui.set_state_3('main_menu', (self.loc.text("In menus"), self.loc.text(self.game_state.queued_state), time_elapsed))
             self.gui.clear_class_image()
             self.gui.set_bottom_text('queued', False)
 
-            if self.game_state.queued_state == "Queued for Casual":
-                self.gui.set_fg_image('casual')
-            elif self.game_state.queued_state == "Queued for Competitive":
-                self.gui.set_fg_image('comp')
-            elif "Queued for MvM" in self.game_state.queued_state:
+            if "Queued for MvM" in self.game_state.queued_state:
                 self.gui.set_fg_image('mvm_queued')
             else:
-                self.gui.set_fg_image('tf2_logo')
+                self.gui.set_fg_image(queued_fg_images.get(self.game_state.queued_state, 'tf2_logo'))
         else:
             gamemode_gui: str = self.game_state.gamemode
 
@@ -386,10 +390,7 @@ class TF2RichPresense:
             if self.game_state.custom_map:
                 self.gui.set_fg_image(f'fg_modes/{gamemode_gui}')
             else:
-                if self.game_state.tf2_map in game_state.map_fallbacks:
-                    self.gui.set_fg_image(f'fg_maps/{game_state.map_fallbacks[self.game_state.tf2_map]}')
-                else:
-                    self.gui.set_fg_image(f'fg_maps/{self.game_state.tf2_map}')
+                self.gui.set_fg_image(f'fg_maps/{game_state.map_fallbacks.get(self.game_state.tf2_map, self.game_state.tf2_map)}')
 
             if self.game_state.queued_state == "Not queued":
                 self.gui.set_bottom_text('queued', False)
@@ -421,8 +422,7 @@ class TF2RichPresense:
         self.gui.set_bottom_text('queued', False)
         self.gui.set_bottom_text('kataiser', False)
 
-        base_window_title: str = self.loc.text("TF2 Rich Presence ({0})").format(launcher.VERSION)
-        window_title: str = self.loc.text("{0} - Waiting for {1}").format(base_window_title, program_name)
+        window_title: str = self.format_window_title_waiting(self.base_window_title, program_name)
         self.gui.master.title(window_title)
         self.log.debug(f"Set window title to \"{window_title}\"")
 
@@ -437,8 +437,11 @@ class TF2RichPresense:
 
             self.rpc_client.update_activity(self.activity)
             self.log.info(f"Sent over RPC: {self.activity}")
-            client_state: tuple = (self.rpc_client.client_id, self.rpc_client.connected, self.rpc_client.ipc_path, self.rpc_client.pid, self.rpc_client.platform, self.rpc_client.socket)
-            self.log.debug(f"Client state: {client_state}")
+
+            if self.log.debug_enabled():
+                client_state: tuple = (self.rpc_client.client_id, self.rpc_client.connected, self.rpc_client.ipc_path, self.rpc_client.pid, self.rpc_client.platform, self.rpc_client.socket)
+                self.log.debug(f"Client state: {client_state}")
+
             self.client_connected = True
         except Exception as client_connect_error:
             if str(client_connect_error) in ("Can't send data to Discord via IPC.", "Can't connect to Discord Client."):
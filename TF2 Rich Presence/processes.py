@@ -46,7 +46,8 @@ class ProcessScanner:
         if self.process_data == self.p_data_last:
             self.log.debug(f"Process scanning got same results (used tasklist: {self.used_tasklist})")
         else:
-            self.log.debug(f"Process scanning (used tasklist: {self.used_tasklist}) results: {self.process_data}")
+            if self.log.debug_enabled():
+                self.log.debug(f"Process scanning (used tasklist: {self.used_tasklist}) results: {self.process_data}")
 
             if not self.process_data['TF2']['running']:
                 self.tf2_without_condebug = False
@@ -65,9 +66,9 @@ class ProcessScanner:
             if len(self.parsed_tasklist) == 3:
                 self.all_pids_cached = True
 
-            self.process_data['TF2']['pid'] = self.parsed_tasklist['hl2.exe'] if 'hl2.exe' in self.parsed_tasklist else None
-            self.process_data['Steam']['pid'] = self.parsed_tasklist['steam.exe'] if 'steam.exe' in self.parsed_tasklist else None
-            self.process_data['Discord']['pid'] = self.parsed_tasklist['discord'] if 'discord' in self.parsed_tasklist else None
+            self.process_data['TF2']['pid'] = self.parsed_tasklist.get('hl2.exe')
+            self.process_data['Steam']['pid'] = self.parsed_tasklist.get('steam.exe')
+            self.process_data['Discord']['pid'] = self.parsed_tasklist.get('discord')
 
             self.get_all_extended_info()
         else:
@@ -124,11 +125,13 @@ class ProcessScanner:
 
         try:
             process: psutil.Process = psutil.Process(pid=pid)
-            running: bool = [name for name in self.executables[os.name] if name in process.name().lower()] != []
+            process_name: str = process.name()
+            process_name_lower: str = process_name.lower()
+            running: bool = any(name in process_name_lower for name in self.executables[os.name])
             p_info['running'] = running
 
             if not running:
-                self.log.error(f"PID {pid} ({process}) has been recycled as {process.name()}")
+                self.log.error(f"PID {pid} ({process}) has been recycled as {process_name}")
                 self.all_pids_cached = False
                 return p_info_nones
 
@@ -5,7 +5,8 @@
 import socket
 import time
 import traceback
-from typing import Dict, List, Optional, Set
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
 import a2s
 
@@ -15,11 +16,16 @@ import settings
 
 # get player count and/or user score (kills) from the game server
 def get_match_data(self, address: str, modes: List[str], usernames: Optional[Set[str]] = None, allow_network_errors: bool = True) -> Dict[str, str]:
+    FAILED_REQUEST_RETRY_TIME: int = 5  # failed requests are retried sooner than the rate limit, but not every loop since each one can block for the entire timeout
+
     rate_limit: int = settings.get('server_rate_limit')
+    failed_request_rewind: int = max(rate_limit - FAILED_REQUEST_RETRY_TIME, 0)
     time_since_last: float = time.time() - self.last_server_request_time
 
     if time_since_last < rate_limit and self.last_server_request_address == address:
-        self.log.debug(f"Skipping getting server data ({round(time_since_last, 1)} < {rate_limit}), persisting {self.last_server_request_data}")
+        if self.log.debug_enabled():
+            self.log.debug(f"Skipping getting server data ({round(time_since_last, 1)} < {rate_limit}), persisting {self.last_server_request_data}")
+
         return self.last_server_request_data
     else:
         self.last_server_request_time = time.time()
@@ -41,12 +47,20 @@ def get_match_data(self, address: str, modes: List[str], usernames: Optional[Set
         ip, ip_socket = address.split(':')
         server_data: Dict[str, str] = {}
 
+        server_address: Tuple[str, int] = (ip, int(ip_socket))
+        request_timeout: float = settings.get('request_timeout')
+
         try:
-            if 'Player count' in modes:
-                server_info = a2s.info((ip, int(ip_socket)), timeout=settings.get('request_timeout'))
+            if 'Player count' in modes and 'Kills' in modes:
+                # the two queries are independent, so run them at the same time instead of waiting for one then the other
+                server_info_future: Future = query_executor.submit(a2s.info, server_address, timeout=request_timeout)
+                players_info = a2s.players(server_address, timeout=request_timeout)
+                server_info = server_info_future.result()
+            elif 'Player count' in modes:
+                server_info = a2s.info(server_address, timeout=request_timeout)
                 # there's a decent amount of extra data here that isn't used but could be (server name, bot count, tags, etc.)
-            if 'Kills' in modes:
-                players_info = a2s.players((ip, int(ip_socket)), timeout=settings.get('request_timeout'))
+            elif 'Kills' in modes:
+                players_info = a2s.players(server_address, timeout=request_timeout)
         except socket.timeout:
             if not allow_network_errors:
                 raise
@@ -57,7 +71,7 @@ def get_match_data(self, address: str, modes: List[str], usernames: Optional[Set
                 self.log.debug("Timed out getting server info")
                 self.last_server_request_data = unknown_data(self.loc, modes)
 
-            self.last_server_request_time -= rate_limit
+            self.last_server_request_time -= failed_request_rewind
             return self.last_server_request_data
         except (a2s.BrokenMessageError, a2s.BrokenMessageError, socket.gaierror, ConnectionRefusedError, ConnectionResetError, OSError) as error:
             if isinstance(error, OSError) and '[WinError 10051]' not in str(error):
@@ -68,7 +82,7 @@ def get_match_data(self, address: str, modes: List[str], usernames: Optional[Set
 
             self.log.error(f"Couldn't get server info: {traceback.format_exc()}")
             self.last_server_request_data = unknown_data(self.loc, modes)
-            self.last_server_request_time -= rate_limit
+            self.last_server_request_time -= failed_request_rewind
             return self.last_server_request_data
 
         if 'Player count' in modes:
@@ -122,3 +136,6 @@ def unknown_data(loc: localization.Localizer, modes: List[str]) -> Dict[str, str
         server_data['kills'] = loc.text("Kills: {0}").format("?")
 
     return server_data
+
+
+query_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
@@ -5,7 +5,7 @@
 import functools
 import json
 import winreg
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 import logger
 
@@ -30,9 +30,9 @@ def access_registry(save: Optional[dict] = None) -> Optional[dict]:
         reg_key_data: dict = json.loads(winreg.QueryValue(reg_key, 'Settings'))
     except FileNotFoundError:  # means that the key hasn't been initialized
         # assume no key means default settings. might not be true but whatever
-        default_settings: dict = defaults()
-        winreg.SetValue(reg_key, 'Settings', winreg.REG_SZ, json.dumps(default_settings, separators=(',', ':')))
-        reg_key_data: dict = default_settings
+        initial_settings: dict = defaults()
+        winreg.SetValue(reg_key, 'Settings', winreg.REG_SZ, json.dumps(initial_settings, separators=(',', ':')))
+        reg_key_data: dict = initial_settings
 
     if save:
         winreg.SetValue(reg_key, 'Settings', winreg.REG_SZ, json.dumps(save, separators=(',', ':')))
@@ -51,27 +51,28 @@ def change(setting: str, value: Union[str, int, bool, float]):
     access_registry(save=current_settings)
 
 
+default_settings: Dict[str, Union[str, int, bool]] = {'sentry_level': 'All errors',
+                                                      'wait_time': 2,
+                                                      'wait_time_slow': 5,
+                                                      'check_updates': True,
+                                                      'request_timeout': 2,
+                                                      'hide_queued_gamemode': False,
+                                                      'log_level': 'Debug',
+                                                      'console_scan_kb': 1024,
+                                                      'language': 'English',
+                                                      'top_line': 'Player count',
+                                                      'bottom_line': 'Time on map',
+                                                      'trim_console_log': True,
+                                                      'server_rate_limit': 10,
+                                                      'gui_scale': 100,
+                                                      'drawing_gamemodes': False,
+                                                      'preserve_window_pos': True}
+
+
 # either gets a settings default, or if return_dict, returns all defaults as a dict
 def get_setting_default(setting: str = '', return_all: bool = False) -> Union[str, int, bool, dict]:
-    default_settings = {'sentry_level': 'All errors',
-                        'wait_time': 2,
-                        'wait_time_slow': 5,
-                        'check_updates': True,
-                        'request_timeout': 2,
-                        'hide_queued_gamemode': False,
-                        'log_level': 'Debug',
-                        'console_scan_kb': 1024,
-                        'language': 'English',
-                        'top_line': 'Player count',
-                        'bottom_line': 'Time on map',
-                        'trim_console_log': True,
-                        'server_rate_limit': 10,
-                        'gui_scale': 100,
-                        'drawing_gamemodes': False,
-                        'preserve_window_pos': True}
-
     if return_all:
-        return default_settings
+        return dict(default_settings)  # a copy, since callers modify and save it
     else:
         return default_settings[setting]
 
@@ -106,9 +107,8 @@ def fix_settings(log):
             del current[current_setting]
             made_fixes = True
 
-        access_registry(save=current)
-
     if made_fixes:
+        access_registry(save=current)
         log.error(f"Fixed settings: added {added}, removed {removed}")
 
 
@@ -413,13 +413,8 @@ def launch():
 
 # checks if a string is an integer between 0 and a supplied maximum (blank is allowed, will get set to default when saving)
 def check_int(text_in_entry: str) -> bool:
-    if text_in_entry == '':
-        return True
-
-    if text_in_entry.isdigit() and int(text_in_entry) >= 0:
-        return True
-
-    return False
+    # isdecimal() (unlike isdigit()) only accepts strings that int() can parse, and they can't be negative
+    return text_in_entry == '' or text_in_entry.isdecimal()
 
 
 if __name__ == '__main__':
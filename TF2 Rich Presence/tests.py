@@ -1,8 +1,10 @@
 # Copyright (C) 2018-2021 Kataiser & https://github.com/Kataiser/tf2-rich-presence/contributors
 # https://github.com/Kataiser/tf2-rich-presence/blob/master/LICENSE
 
+import concurrent.futures
 import gc
 import io
+import json
 import os
 import random
 import shutil
@@ -31,6 +33,15 @@ import settings_gui
 import updater
 import utils
 
+# the activity for a fresh game state, with the start time zeroed
+in_menus_activity = {'details': 'In menus',
+                     'state': 'Not queued',
+                     'timestamps': {'start': 0},
+                     'assets': {'large_image': 'main_menu',
+                                'large_text': 'In menus - TF2 Rich Presence {tf2rpvnum}',
+                                'small_image': 'tf2_logo',
+                                'small_text': 'Team Fortress 2'}}
+
 
 class TestTF2RichPresence(unittest.TestCase):
     def setUp(self):
@@ -197,7 +208,9 @@ class TestTF2RichPresence(unittest.TestCase):
         self.log.info("Test1 饏Ӟ򒚦R៣񘺏1ࠞͳⴺۋ")
         self.log.error(str(SystemError("Test2")), reportable=False)
         self.assertEqual(repr(self.log), r'logger.Log at test_resources\test_self.log (enabled=True, level=Debug, stderr=False)')
+        self.assertTrue(self.log.debug_enabled())
         settings.change('log_level', 'Error')
+        self.assertFalse(self.log.debug_enabled())
         self.log.debug("Gone. Reduced to atoms.")
         settings.change('log_level', 'Off')
         self.assertFalse(self.log.enabled())
@@ -227,8 +240,9 @@ class TestTF2RichPresence(unittest.TestCase):
         # make sure the modified times are actually in order
         shutil.copytree('empty_logs', 'logs')
         empty_logs = sorted(os.listdir('logs'))
+        now = time.time()
         for file_num in range(7):
-            modified_time = time.time() - file_num
+            modified_time = now - file_num
             os.utime(os.path.join('logs', empty_logs[file_num]), times=(modified_time, modified_time))
 
         self.log.cleanup(4)
@@ -242,9 +256,8 @@ class TestTF2RichPresence(unittest.TestCase):
     def test_update_checker(self):
         update_checker = updater.UpdateChecker(self.log)
         update_checker.initiate_update_check(False)
-
-        while not update_checker.update_check_ready():
-            time.sleep(0.2)
+        concurrent.futures.wait([update_checker.api_future])
+        self.assertTrue(update_checker.update_check_ready())
 
         try:
             newest_version, downloads_url, changelog = update_checker.receive_update_check()
@@ -291,6 +304,7 @@ class TestTF2RichPresence(unittest.TestCase):
         self.assertFalse(settings_gui.check_int('a'))
         self.assertFalse(settings_gui.check_int('abc123qwe098'))
         self.assertFalse(settings_gui.check_int('-1'))
+        self.assertFalse(settings_gui.check_int('²'))
 
     def test_settings_access(self):
         default_settings = settings.defaults()
@@ -309,6 +323,34 @@ class TestTF2RichPresence(unittest.TestCase):
         settings.fix_settings(self.log)
         self.assertEqual(settings.access_registry(), settings.defaults())
 
+    def test_access_db(self):
+        utils.flush_db()  # so that DB.json and the cache start out the same
+        db = utils.access_db()
+        old_version = db['available_version']
+
+        with open(utils.db_json_path(), 'r', encoding='UTF8') as db_json:
+            db_on_disk = db_json.read()
+
+        try:
+            db['available_version'] = 'v0.0.0-test'
+            utils.access_db(write=db)
+            self.assertEqual(utils.access_db()['available_version'], 'v0.0.0-test')
+
+            with open(utils.db_json_path(), 'r', encoding='UTF8') as db_json:
+                self.assertEqual(db_json.read(), db_on_disk)  # not written yet
+
+            utils.flush_db()
+            with open(utils.db_json_path(), 'r', encoding='UTF8') as db_json:
+                self.assertEqual(json.load(db_json)['available_version'], 'v0.0.0-test')
+
+            db_read = utils.access_db()
+            db_read['missing_localization'].append("This shouldn't end up in the cache")
+            self.assertNotIn("This shouldn't end up in the cache", utils.access_db()['missing_localization'])
+        finally:
+            db['available_version'] = old_version
+            utils.access_db(write=db)
+            utils.flush_db()
+
     def test_get_api_key(self):
         self.assertEqual(len(utils.get_api_key('discord')), 18)
         self.assertEqual(len(utils.get_api_key('discord2')), 18)
@@ -364,26 +406,33 @@ class TestTF2RichPresence(unittest.TestCase):
         self.assertFalse(process_scanner.hl2_exe_is_tf2(os.getpid()))
 
     def test_settings_gui(self):
-        root = tk.Toplevel()
-        settings_gui_test = settings_gui.GUI(root, self.log)
-        settings_gui_test.wait_time.set(3)
-        settings_gui_test.setting_changed()
-        working_settings = settings_gui_test.get_working_settings()
-        settings_gui_test.update()
-        dimensions = settings_gui_test.window_dimensions
-        settings_gui_test.language.set('日本語')
-        settings_gui_test.update_language('日本語')
-        new_dimensions = settings_gui_test.window_dimensions
-        settings_gui_test.wait_time.set(3)
-        settings_gui_test.save_and_close(force=True)
-
-        self.assertEqual(len(working_settings), len(settings.defaults()))
-        self.assertEqual(working_settings['wait_time'], 3)
-        self.assertEqual(settings.get('wait_time'), 3)
-        self.assertGreaterEqual(dimensions[0], 200)
-        self.assertGreaterEqual(dimensions[1], 200)
-        self.assertGreaterEqual(new_dimensions[0], 200)
-        self.assertGreaterEqual(new_dimensions[1], 200)
+        # an explicit (hidden) parent, otherwise Toplevel() makes a default Tk root that stays open for the rest of the tests
+        parent = tk.Tk()
+        parent.withdraw()
+
+        try:
+            root = tk.Toplevel(parent)
+            settings_gui_test = settings_gui.GUI(root, self.log)
+            settings_gui_test.wait_time.set(3)
+            settings_gui_test.setting_changed()
+            working_settings = settings_gui_test.get_working_settings()
+            settings_gui_test.update()
+            dimensions = settings_gui_test.window_dimensions
+            settings_gui_test.language.set('日本語')
+            settings_gui_test.update_language('日本語')
+            new_dimensions = settings_gui_test.window_dimensions
+            settings_gui_test.wait_time.set(3)
+            settings_gui_test.save_and_close(force=True)
+
+            self.assertEqual(len(working_settings), len(settings.defaults()))
+            self.assertEqual(working_settings['wait_time'], 3)
+            self.assertEqual(settings.get('wait_time'), 3)
+            self.assertGreaterEqual(dimensions[0], 200)
+            self.assertGreaterEqual(dimensions[1], 200)
+            self.assertGreaterEqual(new_dimensions[0], 200)
+            self.assertGreaterEqual(new_dimensions[1], 200)
+        finally:
+            parent.destroy()
 
     def test_localization(self):
         english_lines = localization.access_localization_data()['English']
@@ -437,25 +486,12 @@ class TestTF2RichPresence(unittest.TestCase):
     def test_main_simple(self):
         settings.change('wait_time_slow', 1)
         app = main.TF2RichPresense(self.log)
+        app.game_state.force_zero_start_time = True
         self.assertEqual(repr(app), 'main.TF2RichPresense (state=init)')
-        self.assertEqual(fix_activity_dict(app.game_state.activity()),
-                         {'details': 'In menus',
-                          'state': 'Not queued',
-                          'timestamps': {'start': 0},
-                          'assets': {'large_image': 'main_menu',
-                                     'large_text': 'In menus - TF2 Rich Presence {tf2rpvnum}',
-                                     'small_image': 'tf2_logo',
-                                     'small_text': 'Team Fortress 2'}})
+        self.assertEqual(app.game_state.activity(), in_menus_activity)
         app.run(once=True)
         self.assertEqual(repr(app), 'main.TF2RichPresense (state=no tf2)')
-        self.assertEqual(fix_activity_dict(app.game_state.activity()),
-                         {'details': 'In menus',
-                          'state': 'Not queued',
-                          'timestamps': {'start': 0},
-                          'assets': {'large_image': 'main_menu',
-                                     'large_text': 'In menus - TF2 Rich Presence {tf2rpvnum}',
-                                     'small_image': 'tf2_logo',
-                                     'small_text': 'Team Fortress 2'}})
+        self.assertEqual(app.game_state.activity(), in_menus_activity)
 
         self_process = psutil.Process()
         self.assertEqual(self_process.nice(), psutil.BELOW_NORMAL_PRIORITY_CLASS)
@@ -498,26 +534,20 @@ class TestTF2RichPresence(unittest.TestCase):
     def test_game_state(self):
         game_state_test = game_state.GameState(self.log)
         game_state_test.force_zero_map_time = True
+        game_state_test.force_zero_start_time = True
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'in menus, queued="Not queued"')
 
         game_state_test.set_bulk((True, '', '', '', 'Not queued', False))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'in menus, queued="Not queued"')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
-                         {'details': 'In menus',
-                          'state': 'Not queued',
-                          'timestamps': {'start': 0},
-                          'assets': {'large_image': 'main_menu',
-                                     'large_text': 'In menus - TF2 Rich Presence {tf2rpvnum}',
-                                     'small_image': 'tf2_logo',
-                                     'small_text': 'Team Fortress 2'}})
+        self.assertEqual(game_state_test.activity(), in_menus_activity)
         self.assertFalse(game_state_test.update_rpc)
 
         game_state_test.set_bulk((False, 'koth_highpass', 'Demoman', '', 'Not queued', True))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'Demoman on Highpass, gamemode=koth, hosting=True, queued="Not queued", server=')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
+        self.assertEqual(game_state_test.activity(),
                          {'details': 'Map: Highpass (hosting)',
                           'state': 'Time on map: 0:00',
                           'timestamps': {'start': 0},
@@ -531,7 +561,7 @@ class TestTF2RichPresence(unittest.TestCase):
         game_state_test.set_bulk((False, 'koth_highpass', 'Demoman', '', 'Not queued', True))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'Demoman on Highpass, gamemode=koth, hosting=True, queued="Not queued", server=')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
+        self.assertEqual(game_state_test.activity(),
                          {'details': 'Map: Highpass (hosting)',
                           'state': 'Class: Demoman',
                           'timestamps': {'start': 0},
@@ -573,7 +603,7 @@ class TestTF2RichPresence(unittest.TestCase):
         game_state_test.set_bulk((False, 'cp_catwalk_a5c', 'Soldier', '', 'Queued for Casual', True))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'Soldier on cp_catwalk_a5c, gamemode=control-point, hosting=True, queued="Queued for Casual", server=')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
+        self.assertEqual(game_state_test.activity(),
                          {'details': 'Map: cp_catwalk_a5c (hosting)',
                           'state': 'Queued for Casual',
                           'timestamps': {'start': 0},
@@ -586,7 +616,7 @@ class TestTF2RichPresence(unittest.TestCase):
         game_state_test.set_bulk((False, 'arena_badlands', 'Engineer', '', 'Not queued', True))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'Engineer on Badlands (Arena), gamemode=arena, hosting=True, queued="Not queued", server=')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
+        self.assertEqual(game_state_test.activity(),
                          {'details': 'Map: Badlands (Arena) (hosting)',
                           'state': 'Time on map: 0:00',
                           'timestamps': {'start': 0},
@@ -629,8 +659,7 @@ class TestTF2RichPresence(unittest.TestCase):
         gui_test.menu_about(silent=True)
 
         gui_test.update_checker.initiate_update_check(True)
-        while not gui_test.update_checker.update_check_ready():
-            time.sleep(0.2)
+        concurrent.futures.wait([gui_test.update_checker.api_future])
         gui_test.handle_update_check(gui_test.update_checker.receive_update_check())
 
         fg_image = gui_test.fg_image_load('tf2_logo', 120)
@@ -653,6 +682,12 @@ class TestTF2RichPresence(unittest.TestCase):
                          (('In menus', 'Not queued', '0:00 elapsed'),
                           ('main_menu', 85, 164), 'tf2_logo', ''))
 
+        now = time.time()  # not rounded, so that the elapsed time can't tick over between here and set_gui_from_game_state
+        app.set_gui_from_game_state(now - 65)
+        self.assertEqual(app.gui.text_state, ('In menus', 'Not queued', '1:05 elapsed'))
+        app.set_gui_from_game_state(now - 3723)
+        self.assertEqual(app.gui.text_state, ('In menus', 'Not queued', '1:02:03 elapsed'))
+
         app.game_state.set_bulk((False, 'plr_hightower', 'Heavy', '', 'Not queued', True))
         app.game_state.update_server_data(['Player count'], set())
         app.set_gui_from_game_state()
@@ -739,11 +774,12 @@ class TestTF2RichPresence(unittest.TestCase):
         settings.change('language', 'Spanish')
         game_state_test = game_state.GameState(self.log)
         game_state_test.force_zero_map_time = True
+        game_state_test.force_zero_start_time = True
 
         game_state_test.set_bulk((False, 'ctf_mexico_b4', 'Engineer', '', 'Not queued', True))
         self.assertTrue(game_state_test.update_rpc)
         self.assertEqual(str(game_state_test), 'Engineer on ctf_mexico_b4, gamemode=ctf, hosting=True, queued="Not queued", server=')
-        self.assertEqual(fix_activity_dict(game_state_test.activity()),
+        self.assertEqual(game_state_test.activity(),
                          {'details': 'Mapa: ctf_mexico_b4 (alojamiento)',
                           'state': 'El tiempo en el mapa: 0:00',
                           'timestamps': {'start': 0},
@@ -775,17 +811,13 @@ class TestTF2RichPresence(unittest.TestCase):
             launcher.exc_already_reported(traceback.format_exc())
 
 
+# player counts come from a live server, so normalize them (start times are zeroed via GameState.force_zero_start_time)
 def fix_activity_dict(activity):
-    try:
-        activity['timestamps']['start'] = int(activity['timestamps']['start'] * 0)
-
-        if 'Players:' in activity['state']:
-            activity['state'] = 'Players: 0/0'
+    if 'Players:' in activity.get('state', ''):
+        activity['state'] = 'Players: 0/0'
 
-        if 'Players:' in activity['details']:
-            activity['details'] = 'Players: 0/0'
-    except KeyError:
-        pass
+    if 'Players:' in activity.get('details', ''):
+        activity['details'] = 'Players: 0/0'
 
     return activity
 
@@ -2,10 +2,10 @@
 # https://github.com/Kataiser/tf2-rich-presence/blob/master/LICENSE
 # cython: language_level=3
 
-import time
+import json
 import traceback
-from concurrent.futures import Future
-from typing import Dict, Optional, Tuple, Union
+from concurrent.futures import Future, wait
+from typing import Any, Dict, Optional, Tuple, Union
 
 import launcher
 import logger
@@ -23,6 +23,7 @@ class UpdateChecker:
         self.api_future: Optional[Future] = None
         self.checked_response: bool = False
         self.popup: bool = False
+        self.session: Optional[Any] = None  # a FuturesSession, created on first update check (requests is imported lazily), then reused so that the connection to Github can be kept alive
 
     # initiate the API request, which runs in a seperate thread
     def initiate_update_check(self, popup: bool, timeout: float = float(settings.get('request_timeout'))):
@@ -33,8 +34,15 @@ class UpdateChecker:
         self.log.debug(f"Checking for updates, timeout: {timeout} secs")
         self.popup = popup
         self.checked_response = False
-        from requests_futures.sessions import FuturesSession
-        self.api_future = FuturesSession(max_workers=1).get('https://api.github.com/repos/Kataiser/tf2-rich-presence/releases/latest', timeout=timeout)
+
+        if self.session is None:
+            from requests.adapters import HTTPAdapter
+            from requests_futures.sessions import FuturesSession
+            self.session = FuturesSession(max_workers=1)
+            self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+        # Github either accepts the connection quickly or is unreachable, so don't wait the whole timeout just to connect
+        self.api_future = self.session.get(RELEASES_API_URL, timeout=(min(timeout, CONNECT_TIMEOUT), timeout))
 
     # request either finished or failed
     def update_check_ready(self) -> bool:
@@ -55,7 +63,7 @@ class UpdateChecker:
             self.log.error(f"Non-connection based update error: {traceback.format_exc()}")
         else:
             self.log.debug(f"Update check took {round(result.elapsed.microseconds / 1000000, 3)} seconds")
-            response: dict = result.json()
+            response: dict = json.loads(result.content)  # skips requests' charset detection, json handles UTF-8 bytes directly
             self.api_future = None
 
             try:
@@ -92,9 +100,12 @@ class RateLimitError(Exception):
     pass
 
 
+RELEASES_API_URL: str = 'https://api.github.com/repos/Kataiser/tf2-rich-presence/releases/latest'
+CONNECT_TIMEOUT: float = 2.0
+
+
 if __name__ == '__main__':
     update_checker = UpdateChecker(logger.Log())
     update_checker.initiate_update_check(True, 10.0)
-    while not update_checker.update_check_ready():
-        time.sleep(0.2)
+    wait([update_checker.api_future])
     print(update_checker.receive_update_check())
@@ -3,15 +3,40 @@
 # cython: language_level=3
 
 # note: don't import anything outside of the standard library, in order to avoid unreportable crashes when running the launcher
+import atexit
+import copy
 import functools
 import gzip
 import json
 import os
+import threading
 from typing import Dict, Optional, Union
 
 
-# read from or write to DB.json (intentionally uncached)
+# read from or write to DB.json (cached in memory, writes are flushed to disk shortly after instead of immediately)
 def access_db(write: dict = None, pass_permission_error: bool = True) -> Optional[Dict[str, Union[bool, list, str]]]:
+    global db_cache, db_dirty
+
+    if write:
+        with db_lock:
+            db_cache = copy.deepcopy(write)
+            db_dirty = True
+
+        if pass_permission_error:
+            schedule_db_flush()
+        else:
+            flush_db(pass_permission_error=False)  # the caller wants to know about permission errors now, not later
+    else:
+        with db_lock:
+            if db_cache is None:
+                db_cache = read_db()
+
+            # copied so that callers can't modify the cache without writing
+            return copy.deepcopy(db_cache)
+
+
+# actually read DB.json from disk
+def read_db() -> Dict[str, Union[bool, list, str]]:
     db_path: str = db_json_path()
     default_db: dict = {'tb_hashes': [],
                         'error_hashes': [],
@@ -23,29 +48,55 @@ def access_db(write: dict = None, pass_permission_error: bool = True) -> Optiona
     if not os.path.isfile(db_path):
         open(db_path, 'w').close()
 
-    if write:
-        try:
-            with open(db_path, 'w', encoding='UTF8') as db_json:
-                db_data: dict = write
-                db_json.truncate(0)
-                json.dump(db_data, db_json, indent=4, ensure_ascii=False)
-        except UnicodeEncodeError:
+    try:
+        with open(db_path, 'r', encoding='UTF8') as db_json:
+            return json.load(db_json)
+    except json.JSONDecodeError:
+        write_db(default_db)
+        return default_db
+
+
+# actually write DB.json to disk
+def write_db(db_data: dict, pass_permission_error: bool = True):
+    try:
+        with open(db_json_path(), 'w', encoding='UTF8') as db_json:
+            db_json.truncate(0)
+            json.dump(db_data, db_json, indent=4, ensure_ascii=False)
+    except UnicodeEncodeError:
+        pass
+    except PermissionError:
+        if not pass_permission_error:
+            raise
+    except OSError as error:
+        if str(error) == 'No space left on device':
             pass
-        except PermissionError:
-            if not pass_permission_error:
-                raise
-        except OSError as error:
-            if str(error) == 'No space left on device':
-                pass
-            else:
-                raise
-    else:
-        try:
-            with open(db_path, 'r', encoding='UTF8') as db_json:
-                return json.load(db_json)
-        except json.JSONDecodeError:
-            access_db(write=default_db)
-            return default_db
+        else:
+            raise
+
+
+# write DB.json if it's been changed since the last write
+def flush_db(pass_permission_error: bool = True):
+    global db_dirty, db_flush_timer
+
+    with db_lock:
+        if db_flush_timer is not None:
+            db_flush_timer.cancel()  # in case this is an early flush, the scheduled one has nothing left to do
+            db_flush_timer = None
+
+        if db_dirty:
+            write_db(db_cache, pass_permission_error)
+            db_dirty = False
+
+
+# batches multiple writes that happen close together into one
+def schedule_db_flush():
+    global db_flush_timer
+
+    with db_lock:
+        if db_flush_timer is None:
+            db_flush_timer = threading.Timer(DB_FLUSH_DELAY, flush_db)
+            db_flush_timer.daemon = True
+            db_flush_timer.start()
 
 
 @functools.cache
@@ -53,14 +104,27 @@ def db_json_path() -> str:
     if os.path.isdir(os.path.join(os.getenv('APPDATA'), 'TF2 Rich Presence')):
         return os.path.join(os.getenv('APPDATA'), 'TF2 Rich Presence', 'DB.json')
     else:
-        return 'DB.json'
+        return os.path.abspath('DB.json')  # absolute in case the working directory changes before a delayed flush
 
 
 # get an API key
-@functools.cache
 def get_api_key(service: str) -> str:
+    return api_keys()[service]
+
+
+# all API keys, decoded only once since each service's key is requested separately
+@functools.cache
+def api_keys() -> Dict[str, str]:
     # just some very basic obfuscation
     data: bytes = b'\x1f\x8b\x08\x00bl\xfa_\x02\xff-\x8eK\x0e\xc20\x0c\x05\xef\x925\xa2q\xfc\x12\xdb]q\x954\x1f\xd1\rEm7\x08qw"\xc1\xfa\xe9\xcd\xcc\xdb\xd5\xf5(\xdb^\xdd\xec\x10\x8c\xd5' \
                   b'\x08,1\xb1\xc0\x93\xb8\x8b;\xda\xe3\xdc_c\xbd\x9f\xe7\xf3\x98\xa7\xa96Q*- \xa2#j\xcb=/d\x16\x12\xfb\xa5\x90\xf7si\xe3\xdd\xa3\x19/\x84\x948{\x85/\xd5\xbai\x16B\xbe\xfd' \
                   b'\x90\xd7u\x9bhP\x0c\x18\x9a\x7fE\x18"\x01\xe9\x08\x01\x07\x92\xa0\x91\x84\xdc\xe7\x0b)\x81\xb1\xd4\xa7\x00\x00\x00'
-    return json.loads(gzip.decompress(data))[service]
+    return json.loads(gzip.decompress(data))
+
+
+DB_FLUSH_DELAY: float = 5.0
+db_cache: Optional[dict] = None
+db_dirty: bool = False
+db_flush_timer: Optional[threading.Timer] = None
+db_lock: threading.Lock = threading.Lock()
+atexit.register(flush_db)